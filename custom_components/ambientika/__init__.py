@@ -1,14 +1,19 @@
 """The Ambientika integration."""
 from __future__ import annotations
 
+import ambientika_py as ambientika
+from returns.result import Failure
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import aiohttp_client
 
+from .api import SharedSessionApi
 from .const import DOMAIN
+from .coordinator import AmbientikaCoordinator
 
-# TODO List the platforms that you want to support.
-# For your initial PR, limit it to 1 platform.
 PLATFORMS: list[Platform] = [Platform.CLIMATE]
 
 
@@ -16,10 +21,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Ambientika from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
-    # TODO 1. Create API instance
-    # TODO 2. Validate the API connection (and authentication)
-    # TODO 3. Store an API object for your platforms to access
-    # hass.data[DOMAIN][entry.entry_id] = MyApi(...)
+
+    config = entry.data
+    host = config[CONF_HOST]
+    username = config[CONF_USERNAME]
+    password = config[CONF_PASSWORD]
+
+    # Setup connection with devices/cloud
+    api = await ambientika.authenticate(username, password, host)
+    if isinstance(api, Failure):
+        raise ConfigEntryNotReady(f"Could not connect to API. {api.failure()}")
+    client = api.unwrap()
+
+    # Route every subsequent API call through Home Assistant's shared
+    # session so devices reuse pooled keep-alive connections.
+    session = aiohttp_client.async_get_clientsession(hass)
+    inner = client._api  # pylint: disable=protected-access
+    client._api = SharedSessionApi(  # pylint: disable=protected-access
+        session, inner.host, inner.id, inner.token
+    )
+
+    houses = await client.houses()
+    if isinstance(houses, Failure):
+        raise ConfigEntryNotReady(f"Could not retrieve houses. {houses.failure()}")
+
+    devices = [
+        device
+        for house in houses.unwrap()
+        for room in house.rooms
+        for device in room.devices
+    ]
+
+    coordinator = AmbientikaCoordinator(hass, devices)
+    await coordinator.async_config_entry_first_refresh()
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -0,0 +1,53 @@
+"""Shared-session HTTP layer for the Ambientika API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import ClientSession
+from ambientika_py import AmbientikaApi, HttpError, parse_response_body
+from returns.result import Failure, Result, Success
+
+
+class SharedSessionApi(AmbientikaApi):
+    """An `AmbientikaApi` that reuses a shared aiohttp session.
+
+    `ambientika_py` opens a fresh `ClientSession` for every request, paying
+    the TCP and TLS handshake each time. Routing all calls through Home
+    Assistant's shared session keeps connections pooled and alive.
+    """
+
+    _session: ClientSession
+
+    def __init__(
+        self, session: ClientSession, host: str, id: int, token: str
+    ) -> None:
+        """Initialize the connection with an auth token and a shared session."""
+        super().__init__(host, id, token)
+        self._session = session
+
+    async def get(
+        self, path: str, params: dict[str, Any] = {}
+    ) -> Result[Any, HttpError]:
+        """Fetch JSON data from an authenticated API endpoint."""
+        headers = {"Authorization": f"Bearer {self.token}"}
+        async with self._session.get(
+            url=f"{self.host}/{path}", headers=headers, params=params
+        ) as response:
+            data = await parse_response_body(response)
+            if response.status == 200:
+                return Success(data)
+            else:
+                return Failure({"status_code": response.status, "data": data})
+
+    async def post(self, path: str, body: dict[str, Any]) -> Result[None, HttpError]:
+        """Post JSON data to an authenticated API endpoint."""
+        headers = {"Authorization": f"Bearer {self.token}"}
+        async with self._session.post(
+            url=f"{self.host}/{path}", headers=headers, json=body
+        ) as response:
+            data = await parse_response_body(response)
+            if response.status == 200:
+                return Success(data)
+            else:
+                return Failure({"status_code": response.status, "data": data})
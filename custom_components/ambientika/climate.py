@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import logging
 
-import ambientika_py as ambientika
-from ambientika_py import Device, DeviceStatus, FanSpeed, OperatingMode
-from returns.result import Failure, Success
+from ambientika_py import Device, DeviceMode, DeviceStatus, FanSpeed, OperatingMode
 import voluptuous as vol
 
 from homeassistant.components.climate import PLATFORM_SCHEMA, ClimateEntity
@@ -23,9 +21,19 @@ from homeassistant.core import HomeAssistant
 # Import the device class from the component that you want to support
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import AmbientikaCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# The supported modes are fixed at import time, so build the lists once
+# instead of re-walking the enums on every state read.
+_FAN_MODES: list[str] = list(FanSpeed.__members__)
+_PRESET_MODES: list[str] = list(OperatingMode.__members__)
+_HVAC_MODES: list[HVACMode] = [HVACMode.OFF, HVACMode.FAN_ONLY]
+
 # Validation of the user's configuration
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -37,56 +45,51 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
 
 
 async def async_setup_entry(
-    _hass: HomeAssistant,
+    hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Ambientika platform."""
-    # Assign configuration variables.
-    # The configuration check takes care they are present.
-    config = entry.data
-    host = config[CONF_HOST]
-    username = config[CONF_USERNAME]
-    password = config[CONF_PASSWORD]
-
-    # Setup connection with devices/cloud
-    api = await ambientika.authenticate(username, password, host)
-    match api:
-        case Failure(error):
-            _LOGGER.error("Could not connect to API. %s", error)
-            return
-    houses = await api.unwrap().houses()
-    match houses:
-        case Failure(error):
-            _LOGGER.error("Could not retrieve houses. %s", error)
-            return
-
-    devices = [
-        device
-        for house in houses.unwrap()
-        for room in house.rooms
-        for device in room.devices
-    ]
+    coordinator: AmbientikaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Add devices
-    async_add_entities((AmbientikaFan(device) for device in devices), True)
+    # Add devices. The coordinator's first refresh already fetched every
+    # status in one parallel batch, so no per-entity update is needed here.
+    async_add_entities(
+        AmbientikaFan(coordinator, device) for device in coordinator.devices
+    )
 
 
-class AmbientikaFan(ClimateEntity):
+class AmbientikaFan(CoordinatorEntity[AmbientikaCoordinator], ClimateEntity):
     """Representation of an Ambientika dewvice."""
 
+    # Entity keeps a __dict__, so this cannot shrink the instance, but it
+    # turns every lookup of the hot _device field into a slot access.
+    __slots__ = ("_device",)
+
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_hvac_modes = _HVAC_MODES
+    _attr_fan_modes = _FAN_MODES
+    _attr_preset_modes = _PRESET_MODES
+    _attr_supported_features = (
+        ClimateEntityFeature.FAN_MODE
+        | ClimateEntityFeature.PRESET_MODE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+
     _device: Device
-    _state: DeviceStatus | None
 
-    def __init__(self, device: Device) -> None:
+    def __init__(self, coordinator: AmbientikaCoordinator, device: Device) -> None:
         """Initialize an Ambientika device."""
+        super().__init__(coordinator)
         self._device = device
-        self._state = None
+        self._attr_name = device.name
+        self._attr_unique_id = device.serial_number
 
     @property
-    def name(self) -> str:
-        """Return the display name of this device."""
-        return self._device.name
+    def _state(self) -> DeviceStatus | None:
+        """The last known status of this device, if any."""
+        return self.coordinator.data.get(self._device.serial_number)
 
     @property
     def available(self) -> bool:
@@ -109,12 +112,7 @@ class AmbientikaFan(ClimateEntity):
     def fan_mode(self) -> str | None:
         """Returns the current fan mode."""
         if self._state:
-            return self._state["fan_speed"].name
-
-    @property
-    def fan_modes(self) -> list[str] | None:
-        """Returns the set of available fan modes."""
-        return [name for name, _ in FanSpeed.__members__.items()]
+            return self._state["_fan_speed_name"]
 
     @property
     def hvac_mode(self) -> HVACMode | None:
@@ -125,41 +123,11 @@ class AmbientikaFan(ClimateEntity):
             else:
                 return HVACMode.FAN_ONLY
 
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """List the valid HVAC modes."""
-        return [HVACMode.OFF, HVACMode.FAN_ONLY]
-
-    @property
-    def temperature_unit(self) -> str:
-        """Return the temperature unit."""
-        return UnitOfTemperature.CELSIUS
-
     @property
     def preset_mode(self) -> str | None:
         """Returns the current operating mode."""
         if self._state:
-            return self._state["operating_mode"].name
-
-    @property
-    def preset_modes(self) -> list[str] | None:
-        """Returns the list of available operating modes."""
-        return [name for name, _ in OperatingMode.__members__.items()]
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return the unique ID of the device."""
-        return self._device.serial_number
-
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Returns the features supported by this device."""
-        return (
-            ClimateEntityFeature.FAN_MODE
-            | ClimateEntityFeature.PRESET_MODE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
-        )
+            return self._state["_operating_mode_name"]
 
     @property
     def is_on(self) -> bool | None:
@@ -167,75 +135,76 @@ class AmbientikaFan(ClimateEntity):
         if self._state:
             return self._state["operating_mode"] != OperatingMode.Off
 
+    def _mode_payload(
+        self,
+        operating_mode: OperatingMode | None = None,
+        fan_speed: FanSpeed | None = None,
+    ) -> DeviceMode:
+        """Build a change_mode payload from the last known state.
+
+        Only the keys passed as overrides change; the rest is carried over
+        from the current state.
+        """
+        state = self._state
+        return {
+            "operating_mode": state["operating_mode"]
+            if operating_mode is None
+            else operating_mode,
+            "fan_speed": state["fan_speed"] if fan_speed is None else fan_speed,
+            "humidity_level": state["humidity_level"],
+        }
+
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the fan mode."""
         if self._state:
-            if await self._device.change_mode(
-                {
-                    "operating_mode": self._state["operating_mode"],
-                    "fan_speed": FanSpeed[fan_mode],
-                    "humidity_level": self._state["humidity_level"],
-                }
-            ):
-                self._state["fan_speed"] = FanSpeed[fan_mode]
+            speed = FanSpeed[fan_mode]
+            if await self._device.change_mode(self._mode_payload(fan_speed=speed)):
+                self._state["fan_speed"] = speed
+                self._state["_fan_speed_name"] = fan_mode
+                self.coordinator.invalidate(self._device.serial_number)
+                self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode):
         """Set the new HVAC Mode."""
-        if not self._state:
+        state = self._state
+        if not state:
             return
 
-        if (
-            hvac_mode == HVACMode.OFF
-            and self._state["operating_mode"] != OperatingMode.Off
-        ):
+        if hvac_mode == HVACMode.OFF and state["operating_mode"] != OperatingMode.Off:
+            previous = state["operating_mode"]
             if await self._device.change_mode(
-                {
-                    "operating_mode": OperatingMode.Off,
-                    "fan_speed": self._state["fan_speed"],
-                    "humidity_level": self._state["humidity_level"],
-                }
+                self._mode_payload(operating_mode=OperatingMode.Off)
             ):
-                self._state["last_operating_mode"] = self._state["operating_mode"]
-                self._state["operating_mode"] = OperatingMode.Off
+                state["operating_mode"] = OperatingMode.Off
+                state["_operating_mode_name"] = OperatingMode.Off.name
+                state["last_operating_mode"] = previous
+                self.coordinator.invalidate(self._device.serial_number)
+                self.async_write_ha_state()
         elif (
             hvac_mode == HVACMode.FAN_ONLY
-            and self._state["operating_mode"] == OperatingMode.Off
+            and state["operating_mode"] == OperatingMode.Off
         ):
+            restored = state["last_operating_mode"]
             if await self._device.change_mode(
-                {
-                    "operating_mode": self._state["last_operating_mode"],
-                    "fan_speed": self._state["fan_speed"],
-                    "humidity_level": self._state["humidity_level"],
-                }
+                self._mode_payload(operating_mode=restored)
             ):
-                self._state["operating_mode"] = self._state["last_operating_mode"]
-                self._state["last_operating_mode"] = OperatingMode.Off
+                state["operating_mode"] = restored
+                state["_operating_mode_name"] = restored.name
+                state["last_operating_mode"] = OperatingMode.Off
+                self.coordinator.invalidate(self._device.serial_number)
+                self.async_write_ha_state()
 
     async def async_set_preset_mode(self, preset_mode: str):
         """Set the fan operation mode."""
-        if not self._state:
+        state = self._state
+        if not state:
             return
 
-        if await self._device.change_mode(
-            {
-                "operating_mode": OperatingMode[preset_mode],
-                "fan_speed": self._state["fan_speed"],
-                "humidity_level": self._state["humidity_level"],
-            }
-        ):
-            self._state["last_operating_mode"] = self._state["operating_mode"]
-            self._state["operating_mode"] = self._state["last_operating_mode"]
-
-    async def async_update(self) -> None:
-        """Fetch new state data for this device."""
-        status = await self._device.status()
-        match status:
-            case Success(data):
-                self._state = data
-            case Failure(error):
-                _LOGGER.error(
-                    "Could not fetch status for device %s. %s",
-                    self._device.serial_number,
-                    error,
-                )
-                self._state = None
+        mode = OperatingMode[preset_mode]
+        if await self._device.change_mode(self._mode_payload(operating_mode=mode)):
+            previous = state["operating_mode"]
+            state["operating_mode"] = mode
+            state["_operating_mode_name"] = preset_mode
+            state["last_operating_mode"] = previous
+            self.coordinator.invalidate(self._device.serial_number)
+            self.async_write_ha_state()
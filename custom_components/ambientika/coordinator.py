@@ -0,0 +1,106 @@
+"""Data update coordinator for the Ambientika integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+
+from ambientika_py import Device, DeviceStatus, HttpError
+from returns.result import Result
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+UPDATE_INTERVAL = timedelta(seconds=60)
+STATUS_CACHE_TTL = 5.0
+
+
+class AmbientikaDeviceCache:
+    """Coalesces near-simultaneous status reads for a single device.
+
+    Callers arriving within the TTL await the same in-flight request
+    instead of issuing duplicate HTTP calls to the cloud.
+    """
+
+    device: Device
+
+    def __init__(self, device: Device, ttl: float = STATUS_CACHE_TTL) -> None:
+        """Initialize the cache for a device."""
+        self.device = device
+        self._ttl = ttl
+        self._future: asyncio.Future[Result[DeviceStatus, HttpError]] | None = None
+        self._timestamp = 0.0
+
+    async def status(self) -> Result[DeviceStatus, HttpError]:
+        """Return the device status, reusing a recent or in-flight request."""
+        now = asyncio.get_running_loop().time()
+        if self._future is None or now - self._timestamp >= self._ttl:
+            self._future = asyncio.ensure_future(self.device.status())
+            self._timestamp = now
+        return await self._future
+
+    def invalidate(self) -> None:
+        """Drop the cached status, e.g. after a successful change_mode."""
+        self._future = None
+
+
+class AmbientikaCoordinator(DataUpdateCoordinator[dict[str, DeviceStatus]]):
+    """Coordinator that fetches the status of all devices in one pass."""
+
+    devices: list[Device]
+    _caches: dict[str, AmbientikaDeviceCache]
+
+    def __init__(self, hass: HomeAssistant, devices: list[Device]) -> None:
+        """Initialize the coordinator with the flat list of devices."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.devices = devices
+        self._caches = {
+            device.serial_number: AmbientikaDeviceCache(device) for device in devices
+        }
+
+    def invalidate(self, serial_number: str) -> None:
+        """Drop the cached status for a device so the next read hits the API."""
+        self._caches[serial_number].invalidate()
+
+    async def _async_update_data(self) -> dict[str, DeviceStatus]:
+        """Fetch the status of all devices concurrently."""
+        statuses = await asyncio.gather(
+            *(cache.status() for cache in self._caches.values()),
+            return_exceptions=True,
+        )
+
+        data: dict[str, DeviceStatus] = {}
+        for device, status in zip(self.devices, statuses):
+            if isinstance(status, Exception):
+                _LOGGER.error(
+                    "Could not fetch status for device %s. %s",
+                    device.serial_number,
+                    status,
+                )
+                continue
+            device_status = status.value_or(None)
+            if device_status is not None:
+                # Pre-compute the mode names so the entity properties read
+                # plain strings instead of going through Enum.name.
+                device_status["_fan_speed_name"] = device_status["fan_speed"].name
+                device_status["_operating_mode_name"] = device_status[
+                    "operating_mode"
+                ].name
+                data[device.serial_number] = device_status
+            else:
+                _LOGGER.error(
+                    "Could not fetch status for device %s. %s",
+                    device.serial_number,
+                    status.failure(),
+                )
+        return data